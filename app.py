@@ -5,35 +5,46 @@ Main Flask application for the web interface
 """
 
 import os
-import json
-import schedule
+import hashlib
+import logging
 import time
-import threading
+import orjson
 from datetime import datetime, timedelta
-from flask import Flask, render_template, request, jsonify, send_from_directory
+from functools import lru_cache
+from flask import Flask, Response, render_template, request, jsonify, send_from_directory
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event, exc
+from sqlalchemy.dialects import postgresql, sqlite
+from apscheduler.schedulers.background import BackgroundScheduler
 from arxiv_scraper import ArxivScraper
 from zotero_integration import ZoteroIntegration
 from config import Config
 
 app = Flask(__name__)
 app.config.from_object(Config)
+logging.basicConfig(level=app.config['LOG_LEVEL'], format='%(asctime)s %(levelname)s %(name)s: %(message)s')
 db = SQLAlchemy(app)
 
-# Add custom Jinja2 filter for JSON parsing
-@app.template_filter('from_json')
-def from_json_filter(json_str):
-    """Convert JSON string to Python object"""
-    try:
-        return json.loads(json_str)
-    except (json.JSONDecodeError, TypeError):
-        return []
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Apply the configured PRAGMAs to each new SQLite connection"""
+    cursor = dbapi_connection.cursor()
+    for name, value in app.config['SQLITE_PRAGMAS'].items():
+        cursor.execute(f"PRAGMA {name}={value}")
+    cursor.close()
+
+with app.app_context():
+    if db.engine.dialect.name == 'sqlite':
+        event.listen(db.engine, 'connect', set_sqlite_pragmas)
+
+def orjson_response(obj):
+    """Serialize a JSON response with orjson, which encodes datetimes natively"""
+    return Response(orjson.dumps(obj, option=orjson.OPT_NAIVE_UTC), mimetype='application/json')
 
 # Database Models
 class SearchProfile(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), nullable=False)
-    topics = db.Column(db.Text, nullable=False)  # JSON string of topics
+    topics = db.Column(db.JSON, nullable=False)  # List of topics, stored as JSON
     frequency_hours = db.Column(db.Integer, default=24)
     download_path = db.Column(db.String(500), default='/app/downloads')
     is_active = db.Column(db.Boolean, default=True)
@@ -50,10 +61,92 @@ class DownloadedArticle(db.Model):
     file_path = db.Column(db.String(500))
     profile_id = db.Column(db.Integer, db.ForeignKey('search_profile.id'))
     downloaded_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    # Indexes for the library filters and the default newest-first ordering
+    # (arxiv_id is already covered by its unique constraint)
+    __table_args__ = (
+        db.Index('ix_downloaded_at_desc', downloaded_at.desc()),
+        db.Index('ix_profile_downloaded', 'profile_id', 'downloaded_at'),
+    )
+
+class ArticleSubject(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    article_id = db.Column(db.Integer, db.ForeignKey('downloaded_article.id'), nullable=False, index=True)
+    name = db.Column(db.String(100), nullable=False, index=True)
+
+class ArticleAuthor(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    article_id = db.Column(db.Integer, db.ForeignKey('downloaded_article.id'), nullable=False, index=True)
+    name = db.Column(db.String(255), nullable=False, index=True)
+
+class ZoteroExport(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    article_id = db.Column(db.Integer, db.ForeignKey('downloaded_article.id'), nullable=False)
+    library = db.Column(db.String(50), nullable=False)  # e.g. users/123 or groups/456
+    item_key = db.Column(db.String(20), nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    # One Zotero item per article and library; also serves lookups by library
+    __table_args__ = (
+        db.UniqueConstraint('library', 'article_id'),
+    )
+
+# Characters of the abstract sent with library list results; the full text is only in the detail view
+ABSTRACT_PREVIEW_LENGTH = 200
+
+# Columns selected by the list endpoints, loaded as lightweight rows instead of ORM objects
+DOWNLOAD_LIST_COLUMNS = (
+    DownloadedArticle.id,
+    DownloadedArticle.arxiv_id,
+    DownloadedArticle.title,
+    DownloadedArticle.authors,
+    DownloadedArticle.subjects,
+    DownloadedArticle.file_path,
+    DownloadedArticle.downloaded_at,
+)
+LIBRARY_LIST_COLUMNS = DOWNLOAD_LIST_COLUMNS + (
+    db.func.substr(DownloadedArticle.abstract, 1, ABSTRACT_PREVIEW_LENGTH + 1).label('abstract_preview'),
+    DownloadedArticle.profile_id,
+)
+
+# Dialects whose insert() supports ON CONFLICT DO NOTHING
+INSERT_DIALECTS = {
+    'sqlite': sqlite.insert,
+    'postgresql': postgresql.insert,
+}
+
+# Seconds clients may reuse library stats/categories/authors before revalidating
+LIBRARY_CACHE_MAX_AGE = 60
+
+# Maximum number of arxiv IDs per IN () lookup (SQLite allows 999 parameters)
+EXISTING_ID_CHUNK_SIZE = 500
+
+# SQLite FTS5 index over the library search columns, kept in sync by triggers
+ARTICLE_FTS_DDL = (
+    """CREATE VIRTUAL TABLE IF NOT EXISTS article_fts USING fts5(
+        title, authors, abstract, arxiv_id,
+        content='downloaded_article', content_rowid='id'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS article_fts_insert AFTER INSERT ON downloaded_article BEGIN
+        INSERT INTO article_fts(rowid, title, authors, abstract, arxiv_id)
+        VALUES (new.id, new.title, new.authors, new.abstract, new.arxiv_id);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS article_fts_delete AFTER DELETE ON downloaded_article BEGIN
+        INSERT INTO article_fts(article_fts, rowid, title, authors, abstract, arxiv_id)
+        VALUES ('delete', old.id, old.title, old.authors, old.abstract, old.arxiv_id);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS article_fts_update AFTER UPDATE ON downloaded_article BEGIN
+        INSERT INTO article_fts(article_fts, rowid, title, authors, abstract, arxiv_id)
+        VALUES ('delete', old.id, old.title, old.authors, old.abstract, old.arxiv_id);
+        INSERT INTO article_fts(rowid, title, authors, abstract, arxiv_id)
+        VALUES (new.id, new.title, new.authors, new.abstract, new.arxiv_id);
+    END""",
+)
 
-# Initialize scraper and Zotero integration
+# Initialize scraper, Zotero integration and background scheduler
 scraper = ArxivScraper()
 zotero = ZoteroIntegration()
+scheduler = BackgroundScheduler()
 
 @app.route('/')
 def index():
@@ -65,7 +158,7 @@ def index():
     profiles_dict = [{
         'id': p.id,
         'name': p.name,
-        'topics': json.loads(p.topics),
+        'topics': p.topics,
         'frequency_hours': p.frequency_hours,
         'download_path': p.download_path,
         'is_active': p.is_active,
@@ -83,7 +176,7 @@ def library():
 def get_library_articles():
     """Get all articles with advanced filtering and organization"""
     # Get filter parameters
-    search = request.args.get('search', '')
+    search = request.args.get('search', '').strip()  # Whitespace-only input means no search
     category = request.args.get('category', '')
     author = request.args.get('author', '')
     date_from = request.args.get('date_from', '')
@@ -93,12 +186,18 @@ def get_library_articles():
     sort_order = request.args.get('sort_order', 'desc')
     page = request.args.get('page', 1, type=int)
     per_page = request.args.get('per_page', 20, type=int)
+    per_page = max(1, min(per_page, 100))  # The keyset page needs at least one row for its cursor
+    cursor = request.args.get('cursor')
     
     # Build query
-    query = DownloadedArticle.query
+    query = db.session.query(*LIBRARY_LIST_COLUMNS)
     
     # Apply filters
-    if search:
+    if search and app.config.get('ARTICLE_FTS'):
+        query = query.filter(DownloadedArticle.id.in_(
+            db.text("SELECT rowid FROM article_fts WHERE article_fts MATCH :q").bindparams(q=fts_query(search))
+        ))
+    elif search:
         search_filter = f"%{search}%"
         query = query.filter(
             DownloadedArticle.title.ilike(search_filter) |
@@ -117,7 +216,6 @@ def get_library_articles():
         query = query.filter(DownloadedArticle.profile_id == profile_id)
     
     if date_from:
-        from datetime import datetime
         try:
             date_from_obj = datetime.strptime(date_from, '%Y-%m-%d')
             query = query.filter(DownloadedArticle.downloaded_at >= date_from_obj)
@@ -125,48 +223,76 @@ def get_library_articles():
             pass
     
     if date_to:
-        from datetime import datetime
         try:
             date_to_obj = datetime.strptime(date_to, '%Y-%m-%d')
             query = query.filter(DownloadedArticle.downloaded_at <= date_to_obj)
         except ValueError:
             pass
     
-    # Apply sorting
-    if sort_by == 'title':
-        order_col = DownloadedArticle.title
-    elif sort_by == 'authors':
-        order_col = DownloadedArticle.authors
-    elif sort_by == 'arxiv_id':
-        order_col = DownloadedArticle.arxiv_id
-    else:
-        order_col = DownloadedArticle.downloaded_at
-    
-    if sort_order == 'asc':
-        query = query.order_by(order_col.asc())
+    if cursor is not None:
+        # Keyset pagination: newest first, continuing after the (downloaded_at, id) cursor
+        query = query.order_by(DownloadedArticle.downloaded_at.desc(), DownloadedArticle.id.desc())
+        
+        if cursor:
+            try:
+                cursor_ts, cursor_id = cursor.rsplit('|', 1)
+                cursor_key = (datetime.fromisoformat(cursor_ts), int(cursor_id))
+            except ValueError:
+                return jsonify({'error': 'Invalid cursor'}), 400
+            query = query.filter(
+                db.tuple_(DownloadedArticle.downloaded_at, DownloadedArticle.id) < cursor_key
+            )
+        
+        # Fetch one extra row to find out whether there is a next page
+        items = query.limit(per_page + 1).all()
+        has_next = len(items) > per_page
+        items = items[:per_page]
+        
+        pagination = {
+            'next_cursor': f"{items[-1].downloaded_at.isoformat()}|{items[-1].id}" if has_next else None,
+            'has_next': has_next
+        }
     else:
-        query = query.order_by(order_col.desc())
-    
-    # Paginate
-    articles = query.paginate(page=page, per_page=per_page, error_out=False)
-    
-    return jsonify({
+        # Apply sorting
+        if sort_by == 'title':
+            order_col = DownloadedArticle.title
+        elif sort_by == 'authors':
+            order_col = DownloadedArticle.authors
+        elif sort_by == 'arxiv_id':
+            order_col = DownloadedArticle.arxiv_id
+        else:
+            order_col = DownloadedArticle.downloaded_at
+        
+        if sort_order == 'asc':
+            query = query.order_by(order_col.asc())
+        else:
+            query = query.order_by(order_col.desc())
+        
+        # Paginate
+        articles = query.paginate(page=page, per_page=per_page, error_out=False)
+        items = articles.items
+        
+        pagination = {
+            'total': articles.total,
+            'pages': articles.pages,
+            'current_page': articles.page,
+            'has_next': articles.has_next,
+            'has_prev': articles.has_prev
+        }
+    
+    return orjson_response({
         'articles': [{
             'id': article.id,
             'arxiv_id': article.arxiv_id,
             'title': article.title,
             'authors': article.authors,
-            'abstract': article.abstract,
+            'abstract_preview': article.abstract_preview,
             'subjects': article.subjects,
             'file_path': article.file_path,
             'profile_id': article.profile_id,
-            'downloaded_at': article.downloaded_at.isoformat() if article.downloaded_at else None
-        } for article in articles.items],
-        'total': articles.total,
-        'pages': articles.pages,
-        'current_page': articles.page,
-        'has_next': articles.has_next,
-        'has_prev': articles.has_prev
+            'downloaded_at': article.downloaded_at
+        } for article in items],
+        **pagination
     })
 
 @app.route('/api/library/articles/<int:article_id>', methods=['GET'])
@@ -186,22 +312,44 @@ def get_article_by_id(article_id):
         'downloaded_at': article.downloaded_at.isoformat() if article.downloaded_at else None
     })
 
-@app.route('/api/library/stats', methods=['GET'])
-def get_library_stats():
-    """Get library statistics for dashboard"""
-    total_articles = DownloadedArticle.query.count()
+def library_version(include_profiles=False):
+    """Cheap fingerprint of the library contents, used for ETags and memoization"""
+    version = db.session.query(
+        db.func.count(DownloadedArticle.id),
+        db.func.max(DownloadedArticle.downloaded_at)
+    ).one()
+    version = tuple(version)
+    
+    if include_profiles:
+        version += tuple(db.session.query(SearchProfile.id, SearchProfile.name).order_by(SearchProfile.id))
+        # The recent-activity count depends on the current date
+        version += (datetime.utcnow().date(),)
+    
+    return version
+
+def conditional_library_response(version, build):
+    """Answer with 304 if the client's ETag matches, else build and tag the response"""
+    etag = hashlib.md5(repr(version).encode()).hexdigest()
     
-    # Get category distribution
-    categories = {}
-    articles = DownloadedArticle.query.all()
-    for article in articles:
-        if article.subjects:
-            for subject in article.subjects.split(','):
-                subject = subject.strip()
-                categories[subject] = categories.get(subject, 0) + 1
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+    else:
+        response = jsonify(build(version))
+    
+    response.set_etag(etag)
+    response.cache_control.max_age = LIBRARY_CACHE_MAX_AGE
+    return response
+
+@lru_cache(maxsize=4)
+def build_library_stats(version):
+    """Compute the library statistics; memoized on the library version"""
+    total_articles = DownloadedArticle.query.count()
     
     # Get top categories (limit to top 10)
-    top_categories = sorted(categories.items(), key=lambda x: x[1], reverse=True)[:10]
+    subject_count = db.func.count(ArticleSubject.id)
+    top_categories = db.session.query(
+        ArticleSubject.name, subject_count
+    ).group_by(ArticleSubject.name).order_by(subject_count.desc(), ArticleSubject.name).limit(10).all()
     
     # Get articles by profile
     profile_stats = db.session.query(
@@ -210,42 +358,44 @@ def get_library_stats():
     ).outerjoin(DownloadedArticle).group_by(SearchProfile.id, SearchProfile.name).all()
     
     # Get recent activity (articles downloaded in last 30 days)
-    from datetime import datetime, timedelta
     thirty_days_ago = datetime.utcnow() - timedelta(days=30)
     recent_count = DownloadedArticle.query.filter(
         DownloadedArticle.downloaded_at >= thirty_days_ago
     ).count()
     
-    return jsonify({
+    return {
         'total_articles': total_articles,
-        'categories': top_categories,
+        'categories': [[name, count] for name, count in top_categories],
         'profiles': [{'name': name, 'count': count} for name, count in profile_stats],
         'recent_articles': recent_count
-    })
+    }
+
+@lru_cache(maxsize=4)
+def build_library_categories(version):
+    """List all unique categories; memoized on the library version"""
+    categories = db.session.query(ArticleSubject.name).distinct().order_by(ArticleSubject.name).all()
+    return [name for name, in categories]
+
+@lru_cache(maxsize=4)
+def build_library_authors(version):
+    """List all unique authors; memoized on the library version"""
+    authors = db.session.query(ArticleAuthor.name).distinct().order_by(ArticleAuthor.name).all()
+    return [name for name, in authors]
+
+@app.route('/api/library/stats', methods=['GET'])
+def get_library_stats():
+    """Get library statistics for dashboard"""
+    return conditional_library_response(library_version(include_profiles=True), build_library_stats)
 
 @app.route('/api/library/categories', methods=['GET'])
 def get_library_categories():
     """Get all unique categories for filtering"""
-    categories = set()
-    articles = DownloadedArticle.query.all()
-    for article in articles:
-        if article.subjects:
-            for subject in article.subjects.split(','):
-                categories.add(subject.strip())
-    
-    return jsonify(sorted(list(categories)))
+    return conditional_library_response(library_version(), build_library_categories)
 
 @app.route('/api/library/authors', methods=['GET'])
 def get_library_authors():
     """Get all unique authors for filtering"""
-    authors = set()
-    articles = DownloadedArticle.query.all()
-    for article in articles:
-        if article.authors:
-            for author in article.authors.split(','):
-                authors.add(author.strip())
-    
-    return jsonify(sorted(list(authors)))
+    return conditional_library_response(library_version(), build_library_authors)
 
 @app.route('/profiles')
 def profiles():
@@ -261,7 +411,7 @@ def api_profiles():
         
         profile = SearchProfile(
             name=data['name'],
-            topics=json.dumps(data['topics']),
+            topics=data['topics'],
             frequency_hours=data.get('frequency_hours', 24),
             download_path=data.get('download_path', '/app/downloads'),
             is_active=data.get('is_active', True)
@@ -270,21 +420,18 @@ def api_profiles():
         db.session.add(profile)
         db.session.commit()
         
-        # Schedule the new profile
-        schedule_profile(profile)
-        
         return jsonify({'success': True, 'id': profile.id})
     
     else:
         profiles = SearchProfile.query.all()
-        return jsonify([{
+        return orjson_response([{
             'id': p.id,
             'name': p.name,
-            'topics': json.loads(p.topics),
+            'topics': p.topics,
             'frequency_hours': p.frequency_hours,
             'download_path': p.download_path,
             'is_active': p.is_active,
-            'last_run': p.last_run.isoformat() if p.last_run else None
+            'last_run': p.last_run
         } for p in profiles])
 
 @app.route('/api/profiles/<int:profile_id>', methods=['PUT', 'DELETE'])
@@ -295,16 +442,13 @@ def api_profile_detail(profile_id):
     if request.method == 'PUT':
         data = request.get_json()
         profile.name = data.get('name', profile.name)
-        profile.topics = json.dumps(data.get('topics', json.loads(profile.topics)))
+        profile.topics = data.get('topics', profile.topics)
         profile.frequency_hours = data.get('frequency_hours', profile.frequency_hours)
         profile.download_path = data.get('download_path', profile.download_path)
         profile.is_active = data.get('is_active', profile.is_active)
         
         db.session.commit()
         
-        # Reschedule the profile
-        schedule_profile(profile)
-        
         return jsonify({'success': True})
     
     elif request.method == 'DELETE':
@@ -332,18 +476,18 @@ def api_downloads():
     page = request.args.get('page', 1, type=int)
     per_page = request.args.get('per_page', 20, type=int)
     
-    downloads = DownloadedArticle.query.order_by(
+    downloads = db.session.query(*DOWNLOAD_LIST_COLUMNS).order_by(
         DownloadedArticle.downloaded_at.desc()
     ).paginate(page=page, per_page=per_page, error_out=False)
     
-    return jsonify({
+    return orjson_response({
         'downloads': [{
             'id': d.id,
             'arxiv_id': d.arxiv_id,
             'title': d.title,
             'authors': d.authors,
             'subjects': d.subjects,
-            'downloaded_at': d.downloaded_at.isoformat(),
+            'downloaded_at': d.downloaded_at,
             'file_path': d.file_path
         } for d in downloads.items],
         'total': downloads.total,
@@ -354,7 +498,7 @@ def api_downloads():
 @app.route('/downloads/<path:filename>')
 def download_file(filename):
     """Serve downloaded files"""
-    return send_from_directory('/app/downloads', filename)
+    return send_from_directory(app.config['DEFAULT_DOWNLOAD_PATH'], filename)
 
 @app.route('/api/zotero/test', methods=['GET'])
 def test_zotero_connection():
@@ -373,22 +517,17 @@ def send_to_zotero(article_id):
             "error": "Zotero integration not configured. Please set ZOTERO_API_KEY and ZOTERO_USER_ID environment variables."
         })
     
-    # Prepare article data for Zotero
-    article_data = {
-        'title': article.title,
-        'abstract': article.abstract,
-        'arxiv_id': article.arxiv_id,
-        'authors': article.authors,
-        'subjects': article.subjects,
-        'published': article.downloaded_at.strftime('%Y-%m-%d') if article.downloaded_at else ''
-    }
-    
-    # Get the full file path
-    pdf_path = f"/app/downloads/{article.file_path.split('/')[-1]}" if article.file_path else None
-    
-    result = zotero.create_arxiv_item(article_data, pdf_path)
+    force = bool((request.get_json(silent=True) or {}).get('force'))
+    result = send_articles_to_zotero([article], force=force)[0]
     
-    if result.get('success'):
+    if result.get('already_sent'):
+        return jsonify({
+            "success": True,
+            "message": f"Article '{article.title[:50]}...' is already in Zotero.",
+            "zotero_key": result.get('item_key'),
+            "already_sent": True
+        })
+    elif result.get('success'):
         return jsonify({
             "success": True, 
             "message": f"Article '{article.title[:50]}...' sent to Zotero successfully!",
@@ -400,6 +539,118 @@ def send_to_zotero(article_id):
             "error": result.get('error', 'Unknown error occurred')
         })
 
+@app.route('/api/zotero/send', methods=['POST'])
+def send_many_to_zotero():
+    """Send several downloaded articles to Zotero in batched requests"""
+    payload = request.get_json(silent=True) or {}
+    article_ids = payload.get('article_ids') if isinstance(payload, dict) else None
+    
+    # bool is an int subclass, but true/false are not article IDs
+    if (not isinstance(article_ids, list) or not article_ids
+            or not all(isinstance(article_id, int) and not isinstance(article_id, bool) for article_id in article_ids)):
+        return jsonify({"success": False, "error": "article_ids must be a non-empty list of integer IDs"}), 400
+    
+    if not zotero.is_configured():
+        return jsonify({
+            "success": False, 
+            "error": "Zotero integration not configured. Please set ZOTERO_API_KEY and ZOTERO_USER_ID environment variables."
+        })
+    
+    force = bool(payload.get('force'))
+    articles = DownloadedArticle.query.filter(DownloadedArticle.id.in_(article_ids)).all()
+    sent = dict(zip((article.id for article in articles), send_articles_to_zotero(articles, force=force)))
+    
+    # IDs with no downloaded article are reported as failures rather than dropped
+    results = [
+        (article_id, sent.get(article_id, {"success": False, "error": "not found"}))
+        for article_id in dict.fromkeys(article_ids)
+    ]
+    
+    return jsonify({
+        "success": all(result.get('success') for _, result in results),
+        "results": [{
+            "article_id": article_id,
+            "success": bool(result.get('success')),
+            "zotero_key": result.get('item_key'),
+            "already_sent": bool(result.get('already_sent')),
+            "error": result.get('error')
+        } for article_id, result in results]
+    })
+
+def send_articles_to_zotero(articles, force=False):
+    """Create Zotero items for articles, reusing the item of any already sent to this library"""
+    library = zotero.library_key
+    exports = {
+        export.article_id: export.item_key
+        for export in ZoteroExport.query.filter(
+            ZoteroExport.library == library,
+            ZoteroExport.article_id.in_([article.id for article in articles])
+        )
+    }
+    
+    # Re-sending would only create duplicates, unless the caller asks for it
+    to_send = articles if force else [article for article in articles if article.id not in exports]
+    created = zotero.create_arxiv_items(
+        [zotero_article_data(article) for article in to_send],
+        [article_pdf_path(article) for article in to_send]
+    ) if to_send else []
+    
+    results = dict(zip((article.id for article in to_send), created))
+    rows = [
+        {"article_id": article_id, "library": library, "item_key": result['item_key'], "created_at": datetime.utcnow()}
+        for article_id, result in results.items() if result.get('success')
+    ]
+    if rows:
+        save_zotero_exports(rows)
+        db.session.commit()
+    
+    return [
+        results.get(article.id) or {"success": True, "item_key": exports[article.id], "already_sent": True}
+        for article in articles
+    ]
+
+def save_zotero_exports(rows):
+    """Record created Zotero items, replacing the key stored by an overlapping or forced send"""
+    dialect_insert = INSERT_DIALECTS.get(db.engine.dialect.name)
+    table = ZoteroExport.__table__
+    
+    if dialect_insert:
+        stmt = dialect_insert(table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['library', 'article_id'],
+            set_={'item_key': stmt.excluded.item_key, 'created_at': stmt.excluded.created_at}
+        )
+        db.session.execute(stmt, rows)
+        return
+    
+    # Without ON CONFLICT, update the rows an earlier send left and insert the rest
+    existing = {
+        (export.library, export.article_id): export
+        for export in ZoteroExport.query.filter(ZoteroExport.article_id.in_([row['article_id'] for row in rows]))
+    }
+    for row in rows:
+        export = existing.get((row['library'], row['article_id']))
+        if export:
+            export.item_key = row['item_key']
+            export.created_at = row['created_at']
+        else:
+            db.session.add(ZoteroExport(**row))
+
+def zotero_article_data(article):
+    """Prepare a downloaded article's metadata for Zotero"""
+    return {
+        'title': article.title,
+        'abstract': article.abstract,
+        'arxiv_id': article.arxiv_id,
+        'authors': article.authors,
+        'subjects': article.subjects,
+        'published': article.downloaded_at.strftime('%Y-%m-%d') if article.downloaded_at else ''
+    }
+
+def article_pdf_path(article):
+    """Get the full file path; older rows stored absolute paths, which join leaves as-is"""
+    return os.path.join(app.config['DEFAULT_DOWNLOAD_PATH'], article.file_path) if article.file_path else None
+
 @app.route('/api/zotero/config', methods=['GET'])
 def get_zotero_config():
     """Get Zotero configuration status"""
@@ -416,74 +667,223 @@ def get_zotero_user_info():
     result = zotero.get_user_info()
     return jsonify(result)
 
+def get_existing_arxiv_ids(arxiv_ids):
+    """Return the subset of arxiv_ids that are already in the database"""
+    existing = set()
+    
+    # Chunk the IN () list to stay under SQLite's bound parameter limit
+    for i in range(0, len(arxiv_ids), EXISTING_ID_CHUNK_SIZE):
+        chunk = arxiv_ids[i:i + EXISTING_ID_CHUNK_SIZE]
+        rows = db.session.query(DownloadedArticle.arxiv_id).filter(
+            DownloadedArticle.arxiv_id.in_(chunk)
+        ).all()
+        existing.update(row[0] for row in rows)
+    
+    return existing
+
+def split_terms(value):
+    """Split a comma-separated authors/subjects string into its terms"""
+    if not value:
+        return []
+    return [term.strip() for term in value.split(',') if term.strip()]
+
+def save_article_terms(articles):
+    """Populate the subject and author lookup tables from (article_id, subjects, authors) tuples"""
+    subjects = []
+    authors = []
+    for article_id, article_subjects, article_authors in articles:
+        subjects.extend({'article_id': article_id, 'name': name} for name in split_terms(article_subjects))
+        authors.extend({'article_id': article_id, 'name': name} for name in split_terms(article_authors))
+    
+    db.session.bulk_insert_mappings(ArticleSubject, subjects)
+    db.session.bulk_insert_mappings(ArticleAuthor, authors)
+
+def backfill_article_terms():
+    """Fill the subject/author tables for articles saved before they existed"""
+    indexed_ids = db.session.query(ArticleSubject.article_id).union(
+        db.session.query(ArticleAuthor.article_id)
+    )
+    articles = DownloadedArticle.query.filter(~DownloadedArticle.id.in_(indexed_ids)).all()
+    
+    if articles:
+        print(f"Indexing subjects and authors for {len(articles)} articles")
+        save_article_terms((article.id, article.subjects, article.authors) for article in articles)
+        db.session.commit()
+
+def insert_new_articles(rows):
+    """
+    Insert article rows, letting the database skip arxiv IDs that already exist
+    
+    Returns:
+        list: (id, arxiv_id) of the rows that were actually inserted
+    """
+    if not rows:
+        return []
+    
+    dialect_insert = INSERT_DIALECTS.get(db.engine.dialect.name)
+    table = DownloadedArticle.__table__
+    
+    if dialect_insert:
+        stmt = dialect_insert(table).on_conflict_do_nothing(index_elements=['arxiv_id'])
+    else:
+        stmt = db.insert(table)
+    
+    result = db.session.execute(stmt.returning(table.c.id, table.c.arxiv_id), rows)
+    return result.all()
+
+def fts_query(search):
+    """Turn free-text search input into an FTS5 query matching every word as a prefix"""
+    # Quote each word so FTS5 operators and punctuation in the input are taken literally
+    return ' '.join('"{}"*'.format(word.replace('"', '""')) for word in search.split())
+
+def setup_article_fts():
+    """Create the SQLite full-text index for library search, if FTS5 is available"""
+    if db.engine.dialect.name != 'sqlite':
+        return
+    
+    existed = db.session.execute(
+        db.text("SELECT 1 FROM sqlite_master WHERE name = 'article_fts'")
+    ).first()
+    
+    try:
+        for statement in ARTICLE_FTS_DDL:
+            db.session.execute(db.text(statement))
+        
+        # Index the articles saved before the table existed
+        if not existed:
+            db.session.execute(db.text("INSERT INTO article_fts(article_fts) VALUES ('rebuild')"))
+        db.session.commit()
+    except exc.OperationalError as e:
+        db.session.rollback()
+        print(f"Full-text search unavailable, falling back to LIKE search: {e}")
+        return
+    
+    app.config['ARTICLE_FTS'] = True
+
+def init_db():
+    """Create database tables and bring existing data up to date"""
+    db.create_all()
+    
+    # create_all() skips indexes on tables that already exist
+    for index in DownloadedArticle.__table__.indexes:
+        index.create(db.engine, checkfirst=True)
+    
+    setup_article_fts()
+    backfill_article_terms()
+
 def run_search_profile(profile):
     """Execute a search profile and download new articles"""
-    topics = json.loads(profile.topics)
-    
-    print(f"Running profile '{profile.name}' with topics: {topics}")
+    print(f"Running profile '{profile.name}' with topics: {profile.topics}")
     
     # Search for articles
-    articles = scraper.search_articles(topics, max_results=50)
+    articles = scraper.search_articles(profile.topics, max_results=app.config['DEFAULT_MAX_RESULTS'])
     
     print(f"Found {len(articles)} articles from search")
     
-    downloaded_count = 0
+    return download_profile_articles(profile, articles)
+
+def download_profile_articles(profile, articles):
+    """Download and save the search results a profile does not have yet"""
+    # Look up which articles are already downloaded in one query
+    existing = get_existing_arxiv_ids([article['id'] for article in articles])
     
+    to_fetch = []
     for article in articles:
         print(f"Processing article: {article.get('id', 'Unknown')} - {article.get('title', 'No title')[:100]}...")
         
         # Check if already downloaded
-        existing = DownloadedArticle.query.filter_by(arxiv_id=article['id']).first()
-        if existing:
+        if article['id'] in existing:
             print(f"Article {article['id']} already downloaded, skipping")
             continue
         
-        # Download the article
-        file_path = scraper.download_article(article['id'], profile.download_path)
+        to_fetch.append(article)
+        existing.add(article['id'])
+    
+    # Download the articles concurrently
+    file_paths = scraper.download_articles(
+        [article['id'] for article in to_fetch],
+        profile.download_path,
+        concurrency=app.config['DOWNLOAD_WORKERS']
+    )
+    
+    new_rows = []
+    for article in to_fetch:
+        file_path = file_paths.get(article['id'])
         
         print(f"Download result for {article['id']}: {file_path}")
         
-        if file_path:
-            # Save to database
-            downloaded_article = DownloadedArticle(
-                arxiv_id=article['id'],
-                title=article['title'],
-                authors=', '.join(article['authors']),
-                abstract=article['summary'],
-                subjects=', '.join(article['categories']),
-                file_path=file_path,
-                profile_id=profile.id
-            )
-            
-            db.session.add(downloaded_article)
-            downloaded_count += 1
+        if not file_path:
+            continue
+        
+        new_rows.append({
+            'arxiv_id': article['id'],
+            'title': article['title'],
+            'authors': ', '.join(article['authors']),
+            'abstract': article['summary'],
+            'subjects': ', '.join(article['categories']),
+            'file_path': os.path.relpath(file_path, app.config['DEFAULT_DOWNLOAD_PATH']),
+            'profile_id': profile.id,
+            'downloaded_at': datetime.utcnow()
+        })
+    
+    # Save all new articles in one statement; rows another run inserted meanwhile are skipped
+    inserted = insert_new_articles(new_rows)
+    rows_by_arxiv_id = {row['arxiv_id']: row for row in new_rows}
+    save_article_terms(
+        (article_id, rows_by_arxiv_id[arxiv_id]['subjects'], rows_by_arxiv_id[arxiv_id]['authors'])
+        for article_id, arxiv_id in inserted
+    )
     
     # Update last run time
     profile.last_run = datetime.utcnow()
     db.session.commit()
     
-    return downloaded_count
+    return len(inserted)
 
-def schedule_profile(profile):
-    """Schedule a profile to run at specified intervals"""
-    if not profile.is_active:
-        return
-    
-    job_tag = f"profile_{profile.id}"
-    
-    # Clear existing schedule for this profile
-    schedule.clear(job_tag)
-    
-    # Schedule new job
-    schedule.every(profile.frequency_hours).hours.do(
-        run_search_profile, profile
-    ).tag(job_tag)
+def run_due_profiles():
+    """
+    Scheduler tick: run every active profile that is due
+    
+    Each due profile runs its own search, so every profile gets its full
+    share of results for exactly its own topics. Only a profile with the
+    same topic set as an earlier search is served from the scraper's
+    search cache; overlapping topic sets still query arXiv.
+    """
+    with app.app_context():
+        now = datetime.utcnow()
+        due = [
+            profile for profile in SearchProfile.query.filter_by(is_active=True).all()
+            if not profile.last_run or profile.last_run + timedelta(hours=profile.frequency_hours) <= now
+        ]
+        
+        if not due:
+            return
+        
+        print(f"Running {len(due)} due profiles")
+        
+        for index, profile in enumerate(due):
+            # Space profile runs ARXIV_API_DELAY apart so any that do query arXiv keep to its rate limit
+            if index:
+                time.sleep(app.config['ARXIV_API_DELAY'])
+            
+            try:
+                downloaded_count = run_search_profile(profile)
+                print(f"Profile '{profile.name}' downloaded {downloaded_count} new articles")
+            except Exception as e:
+                db.session.rollback()
+                print(f"Error running profile '{profile.name}': {e}")
 
-def schedule_runner():
-    """Background thread to run scheduled jobs"""
-    while True:
-        schedule.run_pending()
-        time.sleep(60)  # Check every minute
+def start_scheduler():
+    """Start the background scheduler with the profile tick job"""
+    scheduler.add_job(
+        run_due_profiles,
+        'interval',
+        minutes=app.config['SCHEDULER_TICK_MINUTES'],
+        id='run_due_profiles',
+        max_instances=1,
+        coalesce=True
+    )
+    scheduler.start()
 
 if __name__ == '__main__':
     # Ensure data directory exists
@@ -491,16 +891,10 @@ if __name__ == '__main__':
     
     # Create database tables
     with app.app_context():
-        db.create_all()
-        
-        # Schedule existing active profiles
-        profiles = SearchProfile.query.filter_by(is_active=True).all()
-        for profile in profiles:
-            schedule_profile(profile)
-    
-    # Start scheduler in background thread
-    scheduler_thread = threading.Thread(target=schedule_runner, daemon=True)
-    scheduler_thread.start()
+        init_db()
+    
+    # Start the background scheduler
+    start_scheduler()
     
     # Run Flask app
     app.run(host='0.0.0.0', port=5000, debug=False)
@@ -4,18 +4,157 @@ Handles searching and downloading articles from arXiv
 """
 
 import os
+import logging
+import shutil
 import requests
-import xml.etree.ElementTree as ET
-from urllib.parse import urlencode, quote
+import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from lxml import etree
+from io import BytesIO
 import time
 import re
-from datetime import datetime, timedelta
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+# Clark-notation prefix for elements of the arXiv Atom feed
+ATOM_NS = '{http://www.w3.org/2005/Atom}'
+TAG_ENTRY = ATOM_NS + 'entry'
+TAG_ID = ATOM_NS + 'id'
+TAG_TITLE = ATOM_NS + 'title'
+TAG_SUMMARY = ATOM_NS + 'summary'
+TAG_AUTHOR = ATOM_NS + 'author'
+TAG_NAME = ATOM_NS + 'name'
+TAG_CATEGORY = ATOM_NS + 'category'
+TAG_PUBLISHED = ATOM_NS + 'published'
+TAG_UPDATED = ATOM_NS + 'updated'
+TAG_LINK = ATOM_NS + 'link'
+
+# Topics starting with one of these prefixes, or equal to a bare archive name, are category codes
+CATEGORY_PREFIXES = ('cs.', 'math.', 'physics.', 'astro-ph', 'cond-mat', 'quant-ph', 'stat.')
+BARE_CATEGORIES = frozenset({'cs', 'math', 'physics'})
+
+# Version suffix of an arXiv ID (e.g. the 'v2' in '2301.00001v2')
+ID_VERSION_RE = re.compile(r'v\d+$')
+
+# Maximum number of IDs per id_list query to the arXiv API
+ID_LIST_BATCH_SIZE = 400
+
+# Common arXiv categories, grouped by subject
+CATEGORY_CATALOG = {
+    'Computer Science': (
+        'cs.AI', 'cs.CL', 'cs.CV', 'cs.LG', 'cs.NE', 'cs.RO',
+        'cs.CR', 'cs.DB', 'cs.DS', 'cs.IR', 'cs.IT', 'cs.NI'
+    ),
+    'Physics': (
+        'physics.gen-ph', 'physics.class-ph', 'physics.comp-ph',
+        'physics.data-an', 'physics.flu-dyn', 'physics.med-ph'
+    ),
+    'Mathematics': (
+        'math.AG', 'math.AT', 'math.CA', 'math.CO', 'math.CT',
+        'math.DG', 'math.DS', 'math.FA', 'math.GM', 'math.GN'
+    ),
+    'Biology': (
+        'q-bio.BM', 'q-bio.CB', 'q-bio.GN', 'q-bio.MN',
+        'q-bio.NC', 'q-bio.OT', 'q-bio.PE', 'q-bio.QM'
+    ),
+    'Economics': (
+        'econ.EM', 'econ.GN', 'econ.TH'
+    ),
+    'Statistics': (
+        'stat.AP', 'stat.CO', 'stat.ME', 'stat.ML', 'stat.TH'
+    )
+}
+
+# Seconds an arXiv feed's ETag/Last-Modified is kept for revalidating the same query
+FEED_VALIDATOR_TTL = 86400
+
+# Block size for copying PDF downloads to disk
+DOWNLOAD_CHUNK_SIZE = 65536
+
+def _parse_iso(text):
+    """Parse an Atom timestamp such as '2023-01-01T00:00:00Z' into an aware datetime"""
+    if text.endswith('Z'):
+        text = text[:-1] + '+00:00'
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError:
+        return None
+
+@lru_cache(maxsize=32)
+def _start_date_str(today, days_back):
+    """Format the submittedDate lower bound; keyed on today so entries go stale daily"""
+    return (today - timedelta(days=days_back)).strftime('%Y%m%d')
+
+class _TTLCache:
+    """Small thread-safe LRU cache whose entries expire after ttl seconds"""
+    
+    def __init__(self, maxsize=1024, ttl=600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        """Return the cached value for key, or None if it is missing or stale"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            
+            stored_at, value = entry
+            if time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                return None
+            
+            self._entries.move_to_end(key)
+            return value
+    
+    def set(self, key, value):
+        """Store value under key, evicting the least recently used entry when full"""
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
 
 class ArxivScraper:
+    # (connect, read) timeouts for every request to arxiv
+    REQUEST_TIMEOUT = (5, 30)
+    
     def __init__(self):
         self.base_url = "http://export.arxiv.org/api/query"
         self.download_url = "https://arxiv.org/pdf/"
         
+        # Reuse connections to arxiv across searches and downloads,
+        # retrying rate limiting and transient server errors with backoff
+        retry = Retry(total=5, backoff_factor=1, status_forcelist=[429, 500, 502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+        
+        self.session = requests.Session()
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({
+            'User-Agent': 'journalgrabber/1.0',
+            'Accept-Encoding': 'gzip, deflate'
+        })
+        
+        # Search and metadata results, reused while arxiv's answer is unlikely to have changed
+        self._cache = _TTLCache(maxsize=1024, ttl=Config.ARXIV_CACHE_TTL)
+        
+        # ETag/Last-Modified of earlier feed responses with their parsed articles, for conditional GETs
+        self._feed_validators = _TTLCache(maxsize=256, ttl=FEED_VALIDATOR_TTL)
+        
+        # Download directories already known to exist
+        self._known_dirs = set()
+        
     def search_articles(self, topics, max_results=50, days_back=30):
         """
         Search for articles on arXiv based on topics
@@ -28,40 +167,26 @@ class ArxivScraper:
         Returns:
             list: List of article dictionaries
         """
+        cache_key = ('search', tuple(sorted(topics)), max_results, days_back, date.today().isoformat())
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            logger.debug("Using cached arXiv results for topics: %s", topics)
+            return cached
         
         # Separate category codes from keyword terms
-        category_terms = []
-        keyword_terms = []
+        category_terms, keyword_terms = self._split_topics(topics)
         
-        for topic in topics:
-            # Check if it looks like a category code (contains dot or specific prefixes)
-            if ('.' in topic and any(topic.startswith(prefix) for prefix in ['cs.', 'math.', 'physics.', 'astro-ph', 'cond-mat', 'quant-ph', 'stat.'])) or topic in ['cs', 'math', 'physics']:
-                category_terms.append(topic)
-            else:
-                keyword_terms.append(topic)
-        
-        # Build search query parts
+        # Build search query parts: one group for the categories, then each keyword in title and abstract
         search_parts = []
-        
-        # Add category search
         if category_terms:
-            cat_query = " OR ".join([f'cat:"{cat}"' for cat in category_terms])
-            search_parts.append(f'({cat_query})')
+            search_parts.append('(' + ' OR '.join(f'cat:"{cat}"' for cat in category_terms) + ')')
+        search_parts.extend(f'(ti:"{keyword}" OR abs:"{keyword}")' for keyword in keyword_terms)
         
-        # Add keyword search (in title and abstract)
-        if keyword_terms:
-            for keyword in keyword_terms:
-                keyword_query = f'(ti:"{keyword}" OR abs:"{keyword}")'
-                search_parts.append(keyword_query)
-        
-        # Combine all search parts
-        if search_parts:
-            query = " OR ".join(search_parts)
-        else:
-            query = "all"  # Fallback to search all if no valid terms
+        # Combine all search parts, falling back to search all if no valid terms
+        query = ' OR '.join(search_parts) if search_parts else 'all'
         
         # Add date filter for recent articles (increased to 30 days for better results)
-        start_date = (datetime.now() - timedelta(days=days_back)).strftime('%Y%m%d')
+        start_date = _start_date_str(date.today(), days_back)
         query += f' AND submittedDate:[{start_date}* TO *]'
         
         params = {
@@ -72,117 +197,148 @@ class ArxivScraper:
             'sortOrder': 'descending'
         }
         
-        url = f"{self.base_url}?{urlencode(params)}"
-        
-        print(f"ArXiv search URL: {url}")
-        print(f"Search query: {query}")
+        logger.debug("Search query: %s", query)
         
         try:
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
-            
-            print(f"ArXiv response status: {response.status_code}")
-            print(f"Response content length: {len(response.content)}")
-            
-            articles = self._parse_arxiv_response(response.content)
-            print(f"Parsed {len(articles)} articles from response")
+            articles = self._fetch_feed(params)
             
             # If no articles found with date filter, try without it
             if len(articles) == 0 and days_back < 365:
-                print("No results with date filter, trying without date restriction...")
-                
-                # Remove date filter
-                query_no_date = query.split(' AND submittedDate:')[0]
-                params_no_date = params.copy()
-                params_no_date['search_query'] = query_no_date
-                params_no_date['max_results'] = min(max_results, 20)  # Reduce results for broader search
+                logger.info("No results with date filter, trying without date restriction")
                 
-                url_no_date = f"{self.base_url}?{urlencode(params_no_date)}"
-                print(f"Trying without date filter: {url_no_date}")
+                # Remove date filter, reusing the original params
+                params['search_query'] = query.rsplit(' AND submittedDate:', 1)[0]
+                params['max_results'] = min(max_results, 20)  # Reduce results for broader search
                 
-                response_no_date = requests.get(url_no_date, timeout=30)
-                response_no_date.raise_for_status()
-                
-                articles = self._parse_arxiv_response(response_no_date.content)
-                print(f"Found {len(articles)} articles without date filter")
+                articles = self._fetch_feed(params)
+                logger.info("Found %d articles without date filter", len(articles))
             
+            # Empty results may come from a malformed feed, so only cache real hits
+            if articles:
+                self._cache.set(cache_key, articles)
             return articles
             
         except requests.exceptions.RequestException as e:
-            print(f"Error searching arXiv: {e}")
+            logger.error("Error searching arXiv: %s", e)
             return []
     
+    def _split_topics(self, topics):
+        """Split topics into (category codes, keyword terms)"""
+        category_terms = []
+        keyword_terms = []
+        
+        for topic in topics:
+            # Check if it looks like a category code
+            if topic.startswith(CATEGORY_PREFIXES) or topic in BARE_CATEGORIES:
+                category_terms.append(topic)
+            else:
+                keyword_terms.append(topic)
+        
+        return category_terms, keyword_terms
+    
+    def _fetch_feed(self, params):
+        """
+        Fetch and parse an arXiv API feed, revalidating earlier responses
+        
+        If the same query was answered before with an ETag or Last-Modified
+        header, the request is made conditional and a 304 Not Modified
+        reuses the articles parsed last time.
+        
+        Args:
+            params (dict): Query parameters for the API
+            
+        Returns:
+            list: List of article dictionaries
+            
+        Raises:
+            requests.exceptions.RequestException: If the request fails
+        """
+        feed_key = tuple(sorted(params.items()))
+        previous = self._feed_validators.get(feed_key)
+        
+        headers = {}
+        if previous:
+            etag, last_modified, _ = previous
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+        
+        response = self.session.get(self.base_url, params=params, headers=headers, timeout=self.REQUEST_TIMEOUT)
+        response.raise_for_status()
+        
+        logger.debug("ArXiv feed URL: %s", response.url)
+        
+        if response.status_code == 304 and previous:
+            logger.debug("ArXiv feed not modified, reusing %d parsed articles", len(previous[2]))
+            return previous[2]
+        
+        logger.debug("ArXiv response status: %s (Content-Encoding: %s)",
+                     response.status_code, response.headers.get('Content-Encoding', 'none'))
+        logger.debug("Response content length: %d", len(response.content))
+        
+        articles = self._parse_arxiv_response(response.content)
+        logger.debug("Parsed %d articles from response", len(articles))
+        
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if articles and (etag or last_modified):
+            self._feed_validators.set(feed_key, (etag, last_modified, articles))
+        
+        return articles
+    
     def _parse_arxiv_response(self, xml_content):
         """Parse XML response from arXiv API"""
         articles = []
         
         try:
-            root = ET.fromstring(xml_content)
-            
-            # Define namespace
-            ns = {'atom': 'http://www.w3.org/2005/Atom',
-                  'arxiv': 'http://arxiv.org/schemas/atom'}
-            
-            entries = root.findall('atom:entry', ns)
+            # Stream the feed entry by entry instead of building the whole tree; the feed
+            # comes over plain http, so never expand entities or fetch external resources
+            context = etree.iterparse(
+                BytesIO(xml_content), events=('end',), tag=TAG_ENTRY,
+                resolve_entities=False, no_network=True, huge_tree=False
+            )
             
-            for entry in entries:
-                article = {}
-                
-                # Extract ID
-                id_elem = entry.find('atom:id', ns)
-                if id_elem is not None:
-                    article['id'] = id_elem.text.split('/')[-1]
-                
-                # Extract title
-                title_elem = entry.find('atom:title', ns)
-                if title_elem is not None:
-                    article['title'] = title_elem.text.strip().replace('\n', ' ')
-                
-                # Extract summary/abstract
-                summary_elem = entry.find('atom:summary', ns)
-                if summary_elem is not None:
-                    article['summary'] = summary_elem.text.strip().replace('\n', ' ')
+            for _, entry in context:
+                article = {'authors': [], 'categories': []}
                 
-                # Extract authors
-                authors = []
-                author_elems = entry.findall('atom:author', ns)
-                for author_elem in author_elems:
-                    name_elem = author_elem.find('atom:name', ns)
-                    if name_elem is not None:
-                        authors.append(name_elem.text)
-                article['authors'] = authors
-                
-                # Extract categories
-                categories = []
-                category_elems = entry.findall('atom:category', ns)
-                for cat_elem in category_elems:
-                    term = cat_elem.get('term')
-                    if term:
-                        categories.append(term)
-                article['categories'] = categories
-                
-                # Extract published date
-                published_elem = entry.find('atom:published', ns)
-                if published_elem is not None:
-                    article['published'] = published_elem.text
-                
-                # Extract updated date
-                updated_elem = entry.find('atom:updated', ns)
-                if updated_elem is not None:
-                    article['updated'] = updated_elem.text
-                
-                # Extract PDF link
-                links = entry.findall('atom:link', ns)
-                for link in links:
-                    if link.get('type') == 'application/pdf':
-                        article['pdf_url'] = link.get('href')
-                        break
+                # Walk the entry's children once, dispatching on the tag
+                for child in entry:
+                    tag = child.tag
+                    
+                    if tag == TAG_ID:
+                        article['id'] = child.text.split('/')[-1]
+                    elif tag == TAG_TITLE:
+                        article['title'] = child.text.strip().replace('\n', ' ')
+                    elif tag == TAG_SUMMARY:
+                        article['summary'] = child.text.strip().replace('\n', ' ')
+                    elif tag == TAG_AUTHOR:
+                        name_elem = child.find(TAG_NAME)
+                        if name_elem is not None:
+                            article['authors'].append(name_elem.text)
+                    elif tag == TAG_CATEGORY:
+                        term = child.get('term')
+                        if term:
+                            article['categories'].append(term)
+                    elif tag == TAG_PUBLISHED:
+                        article['published'] = _parse_iso(child.text)
+                    elif tag == TAG_UPDATED:
+                        article['updated'] = _parse_iso(child.text)
+                    elif tag == TAG_LINK:
+                        # Keep the first PDF link
+                        if child.get('type') == 'application/pdf' and 'pdf_url' not in article:
+                            article['pdf_url'] = child.get('href')
                 
                 if 'id' in article:
                     articles.append(article)
+                
+                # Free the parsed entry and the siblings before it
+                entry.clear()
+                while entry.getprevious() is not None:
+                    del entry.getparent()[0]
                     
-        except ET.ParseError as e:
-            print(f"Error parsing XML response: {e}")
+        except etree.XMLSyntaxError as e:
+            logger.error("Error parsing XML response: %s", e)
             
         return articles
     
@@ -198,11 +354,13 @@ class ArxivScraper:
             str: Path to downloaded file or None if failed
         """
         
-        # Ensure download directory exists
-        os.makedirs(download_path, exist_ok=True)
+        # Ensure download directory exists, checking each directory once per process
+        if download_path not in self._known_dirs:
+            os.makedirs(download_path, exist_ok=True)
+            self._known_dirs.add(download_path)
         
         # Clean the arXiv ID (remove version if present)
-        clean_id = arxiv_id.split('v')[0]
+        clean_id = ID_VERSION_RE.sub('', arxiv_id)
         
         # Construct download URL
         pdf_url = f"{self.download_url}{clean_id}.pdf"
@@ -213,35 +371,75 @@ class ArxivScraper:
         
         # Check if file already exists
         if os.path.exists(filepath):
-            print(f"File {filename} already exists")
+            logger.debug("File %s already exists", filename)
             return filepath
         
+        tmp_path = None
         try:
-            print(f"Downloading {arxiv_id}...")
-            
-            response = requests.get(pdf_url, timeout=60, stream=True)
-            response.raise_for_status()
+            logger.debug("Downloading %s", arxiv_id)
             
-            # Check if response is actually a PDF
-            content_type = response.headers.get('content-type', '')
-            if 'application/pdf' not in content_type:
-                print(f"Warning: Response may not be a PDF. Content-Type: {content_type}")
+            # PDFs are already compressed, so ask for them as-is
+            with self.session.get(pdf_url, headers={'Accept-Encoding': 'identity'},
+                                  timeout=self.REQUEST_TIMEOUT, stream=True) as response:
+                response.raise_for_status()
+                
+                # Check if response is actually a PDF
+                content_type = response.headers.get('content-type', '')
+                if 'application/pdf' not in content_type:
+                    logger.warning("Response may not be a PDF. Content-Type: %s", content_type)
+                
+                # Write to a temporary file first, copying the raw stream in large blocks,
+                # so an interrupted download never leaves a partial PDF at filepath
+                response.raw.decode_content = True
+                part_path = f"{filepath}.{uuid.uuid4().hex}.part"
+                # Created with mode 0666 so the kernel applies the umask, as open() would for the PDF
+                fd = os.open(part_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+                tmp_path = part_path
+                with os.fdopen(fd, 'wb') as f:
+                    shutil.copyfileobj(response.raw, f, length=DOWNLOAD_CHUNK_SIZE)
             
-            # Write file
-            with open(filepath, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
+            os.replace(tmp_path, filepath)
+            tmp_path = None
             
-            print(f"Successfully downloaded {filename}")
+            logger.info("Successfully downloaded %s", filename)
             return filepath
             
-        except requests.exceptions.RequestException as e:
-            print(f"Error downloading {arxiv_id}: {e}")
+        except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError) as e:
+            # Reading response.raw directly surfaces connection drops as urllib3 errors
+            logger.error("Error downloading %s: %s", arxiv_id, e)
             return None
-        except Exception as e:
-            print(f"Unexpected error downloading {arxiv_id}: {e}")
+        except Exception:
+            logger.exception("Unexpected error downloading %s", arxiv_id)
             return None
+        finally:
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    
+    def download_articles(self, arxiv_ids, download_path='/app/downloads', concurrency=5):
+        """
+        Download several PDF articles from arXiv concurrently
+        
+        Args:
+            arxiv_ids (list): ArXiv IDs to download
+            download_path (str): Directory to save the files
+            concurrency (int): Maximum number of downloads in flight at once
+            
+        Returns:
+            dict: Maps each arXiv ID to its downloaded file path, or None if it failed
+        """
+        results = {}
+        
+        # The downloads are network-bound; the session's pool is shared by the workers
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = {
+                executor.submit(self.download_article, arxiv_id, download_path): arxiv_id
+                for arxiv_id in arxiv_ids
+            }
+            
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        
+        return results
     
     def get_article_info(self, arxiv_id):
         """
@@ -253,24 +451,52 @@ class ArxivScraper:
         Returns:
             dict: Article information or None if not found
         """
+        articles = self.get_articles_info([arxiv_id])
+        return articles[0] if articles else None
+    
+    def get_articles_info(self, arxiv_ids):
+        """
+        Get detailed information about several arXiv articles in batched requests
         
-        params = {
-            'id_list': arxiv_id,
-            'max_results': 1
-        }
-        
-        url = f"{self.base_url}?{urlencode(params)}"
+        Args:
+            arxiv_ids (list): ArXiv IDs, with or without version suffix
+            
+        Returns:
+            list: Article dictionaries for the IDs that were found
+        """
+        articles = []
+        missing = []
+        for arxiv_id in arxiv_ids:
+            cached = self._cache.get(('article', arxiv_id))
+            if cached is not None:
+                articles.append(cached)
+            else:
+                missing.append(arxiv_id)
         
-        try:
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
+        for i in range(0, len(missing), ID_LIST_BATCH_SIZE):
+            # Respect arxiv's rate limit between batches
+            if i:
+                time.sleep(Config.ARXIV_API_DELAY)
             
-            articles = self._parse_arxiv_response(response.content)
-            return articles[0] if articles else None
+            batch = missing[i:i + ID_LIST_BATCH_SIZE]
+            params = {
+                'id_list': ','.join(batch),
+                'max_results': len(batch)
+            }
             
-        except requests.exceptions.RequestException as e:
-            print(f"Error fetching article info for {arxiv_id}: {e}")
-            return None
+            try:
+                batch_articles = self._fetch_feed(params)
+            except requests.exceptions.RequestException as e:
+                logger.error("Error fetching article info for %s: %s", ', '.join(batch), e)
+                continue
+            
+            for article in batch_articles:
+                # Cache under both the versioned and bare ID, since either may be asked for
+                self._cache.set(('article', article['id']), article)
+                self._cache.set(('article', ID_VERSION_RE.sub('', article['id'])), article)
+                articles.append(article)
+        
+        return articles
     
     def search_by_category(self, category, max_results=50, days_back=7):
         """
@@ -284,9 +510,13 @@ class ArxivScraper:
         Returns:
             list: List of article dictionaries
         """
+        cache_key = ('category', category, max_results, days_back, date.today().isoformat())
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
         
         # Add date filter
-        start_date = (datetime.now() - timedelta(days=days_back)).strftime('%Y%m%d')
+        start_date = _start_date_str(date.today(), days_back)
         query = f'cat:{category} AND submittedDate:[{start_date}* TO *]'
         
         params = {
@@ -297,43 +527,18 @@ class ArxivScraper:
             'sortOrder': 'descending'
         }
         
-        url = f"{self.base_url}?{urlencode(params)}"
-        
         try:
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
-            
-            return self._parse_arxiv_response(response.content)
+            articles = self._fetch_feed(params)
+            if articles:
+                self._cache.set(cache_key, articles)
+            return articles
             
         except requests.exceptions.RequestException as e:
-            print(f"Error searching category {category}: {e}")
+            logger.error("Error searching category %s: %s", category, e)
             return []
 
     def get_available_categories(self):
         """
         Return a list of common arXiv categories
         """
-        return {
-            'Computer Science': [
-                'cs.AI', 'cs.CL', 'cs.CV', 'cs.LG', 'cs.NE', 'cs.RO',
-                'cs.CR', 'cs.DB', 'cs.DS', 'cs.IR', 'cs.IT', 'cs.NI'
-            ],
-            'Physics': [
-                'physics.gen-ph', 'physics.class-ph', 'physics.comp-ph',
-                'physics.data-an', 'physics.flu-dyn', 'physics.med-ph'
-            ],
-            'Mathematics': [
-                'math.AG', 'math.AT', 'math.CA', 'math.CO', 'math.CT',
-                'math.DG', 'math.DS', 'math.FA', 'math.GM', 'math.GN'
-            ],
-            'Biology': [
-                'q-bio.BM', 'q-bio.CB', 'q-bio.GN', 'q-bio.MN',
-                'q-bio.NC', 'q-bio.OT', 'q-bio.PE', 'q-bio.QM'
-            ],
-            'Economics': [
-                'econ.EM', 'econ.GN', 'econ.TH'
-            ],
-            'Statistics': [
-                'stat.AP', 'stat.CO', 'stat.ME', 'stat.ML', 'stat.TH'
-            ]
-        }
+        return CATEGORY_CATALOG
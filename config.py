@@ -11,23 +11,35 @@ load_dotenv()
 class Config:
     # Flask configuration
     SECRET_KEY = os.environ.get('SECRET_KEY', 'your-secret-key-change-this')
+    LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO').upper()  # Set to DEBUG to log arXiv query URLs
     
     # Database configuration
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL', 'sqlite:///journalgrabber.db')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     
+    # SQLite connection pragmas (WAL lets library reads run alongside profile writes)
+    SQLITE_PRAGMAS = {
+        'journal_mode': os.environ.get('SQLITE_JOURNAL_MODE', 'WAL'),
+        'synchronous': 'NORMAL',
+        'temp_store': 'MEMORY',
+        'mmap_size': 268435456,  # 256 MB
+    }
+    
     # Download settings
     DEFAULT_DOWNLOAD_PATH = os.environ.get('DOWNLOAD_PATH', '/app/downloads')
     MAX_DOWNLOAD_SIZE_MB = int(os.environ.get('MAX_DOWNLOAD_SIZE_MB', '100'))
+    DOWNLOAD_WORKERS = int(os.environ.get('DOWNLOAD_WORKERS', '5'))  # Concurrent PDF downloads per profile run
     
     # ArXiv API settings
     ARXIV_API_DELAY = float(os.environ.get('ARXIV_API_DELAY', '3.0'))  # Seconds between requests
     DEFAULT_MAX_RESULTS = int(os.environ.get('DEFAULT_MAX_RESULTS', '50'))
     DEFAULT_SEARCH_DAYS = int(os.environ.get('DEFAULT_SEARCH_DAYS', '7'))
+    ARXIV_CACHE_TTL = int(os.environ.get('ARXIV_CACHE_TTL', '600'))  # Seconds search/metadata results are reused
     
     # Scheduler settings
     MIN_FREQUENCY_HOURS = int(os.environ.get('MIN_FREQUENCY_HOURS', '1'))
     MAX_FREQUENCY_HOURS = int(os.environ.get('MAX_FREQUENCY_HOURS', '168'))  # 1 week
+    SCHEDULER_TICK_MINUTES = int(os.environ.get('SCHEDULER_TICK_MINUTES', '15'))  # How often due profiles are collected and run
     
     # Security settings
     ALLOWED_EXTENSIONS = {'pdf'}
@@ -38,3 +50,4 @@ class Config:
     ZOTERO_API_KEY = os.environ.get('ZOTERO_API_KEY', '')
     ZOTERO_USER_ID = os.environ.get('ZOTERO_USER_ID', '')
     ZOTERO_GROUP_ID = os.environ.get('ZOTERO_GROUP_ID', '')  # Optional: for group libraries
+    ZOTERO_UPLOAD_WORKERS = int(os.environ.get('ZOTERO_UPLOAD_WORKERS', '8'))  # Concurrent PDF uploads when sending many articles
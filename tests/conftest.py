@@ -0,0 +1,5 @@
+import os
+import tempfile
+
+# Config reads DATABASE_URL at import, so point it at a throwaway database before any test imports the app
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'test.db')
@@ -0,0 +1,13 @@
+from app import app, db, init_db, DownloadedArticle
+
+
+def test_library_keyset_page_with_zero_per_page():
+    with app.app_context():
+        init_db()
+        db.session.add(DownloadedArticle(arxiv_id='2401.00001', title='Title'))
+        db.session.commit()
+    
+    response = app.test_client().get('/api/library/articles?cursor=&per_page=0')
+    
+    assert response.status_code == 200
+    assert len(response.get_json()['articles']) == 1
@@ -0,0 +1,22 @@
+from arxiv_scraper import ArxivScraper
+
+XXE_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE feed [<!ENTITY x SYSTEM "file:///etc/hostname">]>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <entry>
+    <id>http://arxiv.org/abs/2401.00001v1</id>
+    <title>Title &x;</title>
+    <summary>Abstract</summary>
+  </entry>
+</feed>
+"""
+
+
+def test_parse_does_not_expand_external_entities(tmp_path):
+    secret = tmp_path / 'secret.txt'
+    secret.write_text('TOPSECRET')
+    feed = XXE_FEED.replace(b'file:///etc/hostname', secret.as_uri().encode())
+    
+    articles = ArxivScraper()._parse_arxiv_response(feed)
+    
+    assert 'TOPSECRET' not in repr(articles)
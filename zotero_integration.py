@@ -4,27 +4,340 @@ Handles sending articles to Zotero libraries
 """
 
 import os
-from pyzotero import zotero
+import stat
+import time
+import logging
+import threading
+import json
+from collections import defaultdict
+from functools import cached_property, lru_cache
+from concurrent.futures import ThreadPoolExecutor
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.fields import RequestField
+from urllib3.filepost import choose_boundary
 from config import Config
 
+logger = logging.getLogger(__name__)
+
+# pyzotero's own logging is only interesting when something goes wrong
+logging.getLogger('pyzotero').setLevel(logging.WARNING)
+
+# Maximum number of items the Zotero API accepts in one write request
+CREATE_ITEMS_BATCH_SIZE = 50
+
+# Fixed fields of the preprint items created for arXiv articles; Zotero fills in the
+# fields left out, so items need no template request or copy of the full schema
+PREPRINT_TEMPLATE = {
+    'itemType': 'preprint',
+    'repository': 'arXiv',
+    'extra': ''
+}
+
+# Item URLs are built from the arXiv ID on every article
+ARXIV_ABS_URL = 'https://arxiv.org/abs/'
+
+# Upper bound on concurrent uploads, whatever ZOTERO_UPLOAD_WORKERS says; each upload is
+# three Zotero writes, and more parallel writes than this just draws 429s
+MAX_UPLOAD_WORKERS = 10
+
+# Seconds key and group metadata from the Zotero API is reused; a group's name and
+# settings rarely change, so its metadata is kept for a day
+API_INFO_TTL = 300
+GROUP_INFO_TTL = 86400
+
+# Read buffer for PDFs streamed to Zotero's storage, so large files are read in big sequential blocks
+UPLOAD_BUFFER_SIZE = 1024 * 1024
+
+class _PooledRequests:
+    """Stand-in for the requests module inside pyzotero that sends every call through one Session"""
+    
+    HTTP_METHODS = frozenset({'request', 'get', 'post', 'put', 'patch', 'delete', 'head'})
+    
+    def __init__(self, session):
+        self.session = session
+    
+    def __getattr__(self, name):
+        # requests.exceptions, Request and the rest still come from the real module
+        if name in self.HTTP_METHODS:
+            return getattr(self.session, name)
+        return getattr(requests, name)
+
+class _ZoteroRetry(Retry):
+    """Retry policy that also retries writes, but only when Zotero rate limited them"""
+    
+    def is_retry(self, method, status_code, has_retry_after=False):
+        # A 429 means the request was not processed, so repeating a POST/PATCH is safe;
+        # 5xx responses are still only retried for idempotent methods
+        if status_code == 429:
+            return bool(self.total)
+        return super().is_retry(method, status_code, has_retry_after)
+
+class _OrjsonJson:
+    """Stand-in for the json module inside pyzotero that encodes and decodes with orjson"""
+    
+    def dumps(self, obj, **kwargs):
+        # pyzotero only ever sends the result as a request body, so UTF-8 bytes are fine
+        if kwargs:
+            return json.dumps(obj, **kwargs)
+        return orjson.dumps(obj)
+    
+    def loads(self, text, **kwargs):
+        # orjson has no object_pairs_hook (used for preserve_json_order)
+        if kwargs:
+            return json.loads(text, **kwargs)
+        return orjson.loads(text)
+    
+    def __getattr__(self, name):
+        return getattr(json, name)
+
+def _orjson_response_hook(response, *args, **kwargs):
+    """Give each Zotero response a .json() that parses with orjson"""
+    parse = response.json
+    
+    def orjson_json(**json_kwargs):
+        if json_kwargs or not response.content:
+            return parse(**json_kwargs)
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            # Let requests raise its usual error for a non-JSON body
+            return parse()
+    
+    response.json = orjson_json
+    return response
+
+def _pooled_session():
+    """Build a keep-alive session for the Zotero API and its file upload hosts"""
+    # Exponential backoff, waiting for Retry-After when Zotero sends one
+    retry = _ZoteroRetry(
+        total=8,
+        backoff_factor=1.0,
+        status_forcelist=[429, 500, 502, 503, 504],
+        respect_retry_after_header=True
+    )
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=retry)
+    
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.hooks['response'].append(_orjson_response_hook)
+    return session
+
+# pyzotero module, imported the first time a configured client is created
+_zotero = None
+
+def _load_pyzotero():
+    """Import pyzotero on first use, so unconfigured installs never load it"""
+    global _zotero
+    if _zotero is None:
+        from pyzotero import zotero
+        _zotero = zotero
+    return _zotero
+
+def _install_pooled_session():
+    """Route pyzotero's module-level requests calls through one shared session"""
+    zotero = _load_pyzotero()
+    if isinstance(getattr(zotero, 'requests', None), _PooledRequests):
+        return zotero.requests.session
+    
+    # Only versions that call the requests module directly need the stand-in
+    if getattr(zotero, 'requests', None) is not requests:
+        return None
+    
+    zotero.requests = _PooledRequests(_pooled_session())
+    
+    # Bulk creates send and receive up to 50 items with abstracts, so encode them with orjson too
+    if getattr(zotero, 'json', None) is json:
+        zotero.json = _OrjsonJson()
+    return zotero.requests.session
+
+class _MultipartFileBody:
+    """multipart/form-data request body that reads its file part from disk as it is sent"""
+    
+    def __init__(self, fields, file_path):
+        boundary = choose_boundary()
+        self.content_type = f'multipart/form-data; boundary={boundary}'
+        
+        head = []
+        for name, value in fields:
+            field = RequestField(name, str(value))
+            field.make_multipart()
+            head.append(f'--{boundary}\r\n{field.render_headers()}{value}\r\n')
+        file_field = RequestField('file', b'', filename=os.path.basename(file_path))
+        file_field.make_multipart(content_type='application/octet-stream')
+        head.append(f'--{boundary}\r\n{file_field.render_headers()}')
+        self._head = ''.join(head).encode('utf-8')
+        self._tail = f'\r\n--{boundary}--\r\n'.encode('utf-8')
+        
+        self._file = open(file_path, 'rb', buffering=UPLOAD_BUFFER_SIZE)
+        self._file_end = len(self._head) + os.fstat(self._file.fileno()).st_size
+        self._length = self._file_end + len(self._tail)
+        self._position = 0
+    
+    def __len__(self):
+        return self._length
+    
+    def __iter__(self):
+        return iter(lambda: self.read(UPLOAD_BUFFER_SIZE), b'')
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def read(self, size=-1):
+        if size is None or size < 0:
+            size = self._length
+        
+        head_size = len(self._head)
+        if self._position < head_size:
+            data = self._head[self._position:self._position + size]
+        elif self._position < self._file_end:
+            # urllib3 rewinds with seek() to resend the body on a retry
+            self._file.seek(self._position - head_size)
+            data = self._file.read(min(size, self._file_end - self._position))
+        else:
+            data = self._tail[self._position - self._file_end:self._position - self._file_end + size]
+        
+        self._position += len(data)
+        return data
+    
+    def tell(self):
+        return self._position
+    
+    def seek(self, offset, whence=os.SEEK_SET):
+        base = {os.SEEK_SET: 0, os.SEEK_CUR: self._position, os.SEEK_END: self._length}[whence]
+        self._position = max(0, min(base + offset, self._length))
+        return self._position
+    
+    def close(self):
+        self._file.close()
+
+def _streaming_upload_file(self, authdata, attachment, reg_key):
+    """Zupload step 2, posting the file to Zotero's storage without reading it into memory first"""
+    zotero = _load_pyzotero()
+    
+    # The storage policy's key field has to come first and the file last
+    upload_dict = authdata["params"]
+    fields = [("key", upload_dict.pop("key"))] + list(upload_dict.items())
+    
+    with _MultipartFileBody(fields, attachment) as body:
+        try:
+            self.zinstance._check_backoff()
+            upload = zotero.requests.post(
+                url=authdata["url"],
+                data=body,
+                headers={"Content-Type": body.content_type, "User-Agent": "Pyzotero/%s" % zotero.pz.__version__}
+            )
+        except requests.exceptions.ConnectionError:
+            raise zotero.ze.UploadError("ConnectionError")
+    
+    try:
+        upload.raise_for_status()
+    except requests.exceptions.HTTPError as exc:
+        zotero.error_handler(self.zinstance, upload, exc)
+    backoff = upload.headers.get("backoff") or upload.headers.get("retry-after")
+    if backoff:
+        self.zinstance._set_backoff(backoff)
+    return self._register_upload(authdata, reg_key)
+
+def _install_streaming_upload():
+    """Swap pyzotero's upload step, which reads each whole PDF into memory, for a streaming one"""
+    zotero = _load_pyzotero()
+    
+    # Only patch the pyzotero layout the replacement was written against
+    upload_cls = getattr(zotero, 'Zupload', None)
+    if not all(hasattr(zotero, name) for name in ('pz', 'ze', 'error_handler', 'requests')):
+        return
+    if upload_cls is None or not hasattr(upload_cls, '_upload_file') or not hasattr(upload_cls, '_register_upload'):
+        return
+    upload_cls._upload_file = _streaming_upload_file
+
+def _as_list(value):
+    """Return authors/subjects as a list, whether stored comma-separated or already split"""
+    if not value:
+        return ()
+    if isinstance(value, str):
+        return value.split(',')
+    return value
+
+@lru_cache(maxsize=8192)
+def _author_to_creator(author):
+    """Split an author name into Zotero creator fields, as hashable (key, value) pairs"""
+    # Collapse runs of whitespace, then split once from the right: only the last word is the last name
+    name = ' '.join(author.split())
+    parts = name.rsplit(' ', 1) if name else []
+    if len(parts) == 2:
+        return (("creatorType", "author"), ("firstName", parts[0]), ("lastName", parts[1]))
+    if parts:
+        return (("creatorType", "author"), ("name", parts[0]))
+    return ()
+
 class ZoteroIntegration:
     def __init__(self):
         self.api_key = Config.ZOTERO_API_KEY
         self.user_id = Config.ZOTERO_USER_ID
         self.group_id = Config.ZOTERO_GROUP_ID
         
-        # Initialize pyzotero client
-        self.zot = None
-        if self.is_configured():
-            try:
-                if self.group_id:
-                    # Use group library
-                    self.zot = zotero.Zotero(self.group_id, 'group', self.api_key)
-                else:
-                    # Use user library
-                    self.zot = zotero.Zotero(self.user_id, 'user', self.api_key)
-            except Exception as e:
-                print(f"Warning: Failed to initialize Zotero client: {e}")
+        # Pooled session pyzotero sends through, set once the client is built
+        self.session = None
+        
+        # Key and group metadata responses by API path, as (fetched_at, data)
+        self._api_info_cache = {}
+        
+        # Upload workers shared by every bulk send, so threads are started once and
+        # concurrent requests together stay within ZOTERO_UPLOAD_WORKERS uploads
+        self._upload_executor = None
+        self._upload_executor_lock = threading.Lock()
+        
+        # pyzotero clients for the upload worker threads, one per thread
+        self._thread_clients = threading.local()
+    
+    @cached_property
+    def zot(self):
+        """pyzotero client, built on first use so status checks never import or construct it"""
+        if not self.is_configured():
+            return None
+        
+        try:
+            zot = self._new_client()
+        except Exception as e:
+            logger.warning("Failed to initialize Zotero client: %s", e)
+            return None
+        
+        # pyzotero calls requests.get/post/... directly, opening a new connection every
+        # time; route those calls through one pooled session instead
+        self.session = _install_pooled_session()
+        _install_streaming_upload()
+        return zot
+    
+    def _new_client(self):
+        """Construct a pyzotero client for the configured library"""
+        zotero = _load_pyzotero()
+        if self.group_id:
+            # Use group library
+            return zotero.Zotero(self.group_id, 'group', self.api_key)
+        # Use user library
+        return zotero.Zotero(self.user_id, 'user', self.api_key)
+    
+    def _thread_client(self):
+        """Return the calling thread's own pyzotero client"""
+        # A Zotero instance keeps each response on self.request and reads it back (template
+        # fetches, backoff headers), so upload workers must not share the main client
+        client = getattr(self._thread_clients, 'zot', None)
+        if client is None:
+            client = self._new_client()
+            self._thread_clients.zot = client
+        return client
+    
+    @property
+    def library_key(self):
+        """API path prefix of the configured library, e.g. users/123 or groups/456"""
+        return f"groups/{self.group_id}" if self.group_id else f"users/{self.user_id}"
     
     def is_configured(self):
         """Check if Zotero integration is properly configured"""
@@ -41,79 +354,96 @@ class ZoteroIntegration:
         Returns:
             dict: Response from Zotero API or error info
         """
-        if not self.is_configured() or not self.zot:
-            return {"success": False, "error": "Zotero not configured properly"}
+        return self.create_arxiv_items([article_data], [pdf_path])[0]
+    
+    def create_arxiv_items(self, articles, pdf_paths=None):
+        """
+        Create Zotero items for several arXiv articles, up to 50 per API request
         
-        try:
-            # Create the item template using pyzotero's item template
-            template = self.zot.item_template('preprint')
+        Args:
+            articles: List of dictionaries containing article metadata
+            pdf_paths: Optional list of PDF paths, one per article (None to skip)
             
-            # Fill in the article data
-            template['title'] = article_data.get('title', '')
-            template['abstractNote'] = article_data.get('abstract', '')
-            template['repository'] = 'arXiv'
-            template['archiveID'] = article_data.get('arxiv_id', '')
-            template['url'] = f"https://arxiv.org/abs/{article_data.get('arxiv_id', '')}"
-            template['date'] = article_data.get('published', '')
+        Returns:
+            list: One response or error info dict per article, in order
+        """
+        if not self.is_configured() or not self.zot:
+            return [{"success": False, "error": "Zotero not configured properly"} for _ in articles]
+        
+        if pdf_paths is None:
+            pdf_paths = [None] * len(articles)
+        
+        results = []
+        pending_attachments = []
+        for start in range(0, len(articles), CREATE_ITEMS_BATCH_SIZE):
+            batch = articles[start:start + CREATE_ITEMS_BATCH_SIZE]
+            batch_pdf_paths = pdf_paths[start:start + CREATE_ITEMS_BATCH_SIZE]
             
-            # Clear default creators and add authors
-            template['creators'] = []
-            if 'authors' in article_data and article_data['authors']:
-                if isinstance(article_data['authors'], str):
-                    authors = [a.strip() for a in article_data['authors'].split(',')]
-                else:
-                    authors = article_data['authors']
+            try:
+                templates = [self._build_template(article_data) for article_data in batch]
                 
-                for author in authors:
-                    # Split name into first and last
-                    name_parts = author.strip().split()
-                    if len(name_parts) >= 2:
-                        creator = {
-                            "creatorType": "author",
-                            "firstName": " ".join(name_parts[:-1]),
-                            "lastName": name_parts[-1]
-                        }
-                    else:
-                        creator = {
-                            "creatorType": "author",
-                            "name": author.strip()
-                        }
-                    template['creators'].append(creator)
-            
-            # Clear default tags and add subjects
-            template['tags'] = []
-            if 'subjects' in article_data and article_data['subjects']:
-                subjects = article_data['subjects'].split(',') if isinstance(article_data['subjects'], str) else article_data['subjects']
-                for subject in subjects:
-                    template['tags'].append({"tag": subject.strip()})
-            
-            print(f"Creating Zotero item: {template['title']}")
-            
-            # Create the item using pyzotero
-            created_items = self.zot.create_items([template])
+                logger.debug("Creating %d Zotero item(s)", len(templates))
+                
+                # Create the items using pyzotero
+                created_items = self.zot.create_items(templates)
+            except Exception as e:
+                results.extend({"success": False, "error": f"Error creating Zotero item: {str(e)}"} for _ in batch)
+                continue
             
-            if created_items['successful']:
-                # Fix: Get the actual item key from the response
-                item_info = created_items['successful']['0']  # The key '0' is the index, not the item key
+            # Responses are keyed by each template's index in the request
+            attachments = []
+            for index, pdf_path in enumerate(batch_pdf_paths):
+                item_info = created_items['successful'].get(str(index))
+                if not item_info:
+                    error_details = created_items.get('failed', {}).get(str(index), created_items.get('failed', {}))
+                    results.append({"success": False, "error": f"Failed to create item: {error_details}"})
+                    continue
+                
                 item_key = item_info['key']  # Get the actual Zotero item key
-                print(f"Successfully created Zotero item with key: {item_key}")
+                logger.info("Created Zotero item with key: %s", item_key)
                 
-                # If PDF provided, attach it
-                if pdf_path and self._file_exists(pdf_path):
-                    attachment_result = self.add_pdf_attachment(item_key, pdf_path)
-                    return {
-                        "success": True, 
-                        "item_key": item_key,
-                        "attachment": attachment_result
-                    }
+                result = {"success": True, "item_key": item_key}
+                results.append(result)
                 
-                return {"success": True, "item_key": item_key}
-            else:
-                error_details = created_items.get('failed', {})
-                return {"success": False, "error": f"Failed to create item: {error_details}"}
-                
-        except Exception as e:
-            return {"success": False, "error": f"Error creating Zotero item: {str(e)}"}
+                # If PDF provided, queue it for attaching
+                if pdf_path and self._file_exists(pdf_path):
+                    attachments.append((result, pdf_path))
+            
+            # Start the batch's PDF uploads and move on to creating the next batch meanwhile
+            if attachments:
+                group_futures = self._submit_pdf_groups(
+                    [(result['item_key'], pdf_path) for result, pdf_path in attachments]
+                )
+                pending_attachments.append((attachments, group_futures))
+        
+        for attachments, group_futures in pending_attachments:
+            for result, pdf_path in attachments:
+                result['attachment'] = group_futures[result['item_key']].result()[pdf_path]
+        
+        return results
+    
+    def _build_template(self, article_data):
+        """Fill a Zotero preprint template from arXiv article data"""
+        arxiv_id = article_data.get('arxiv_id', '')
+        
+        # Split the authors into first and last names, and make a tag of each subject
+        creators = (_author_to_creator(author) for author in _as_list(article_data.get('authors')))
+        subjects = (subject.strip() for subject in _as_list(article_data.get('subjects')))
+        
+        template = {
+            **PREPRINT_TEMPLATE,
+            'title': article_data.get('title', ''),
+            'abstractNote': article_data.get('abstract', ''),
+            'archiveID': arxiv_id,
+            'url': ARXIV_ABS_URL + arxiv_id,
+            'date': article_data.get('published', ''),
+            'creators': [dict(creator) for creator in creators if creator],
+            'tags': [{"tag": subject} for subject in subjects if subject],
+            'collections': [],
+            'relations': {}
+        }
+        
+        return template
     
     def add_pdf_attachment(self, parent_item_key, pdf_path):
         """
@@ -126,135 +456,131 @@ class ZoteroIntegration:
         Returns:
             dict: Success/error response
         """
+        if not self.zot:
+            return {"success": False, "error": "Zotero not configured properly"}
+        
         try:
-            if not self._file_exists(pdf_path):
+            # Get the file info from a single stat
+            file_stat = self._file_stat(pdf_path)
+            if file_stat is None:
                 return {"success": False, "error": "PDF file not found"}
             
-            print(f"Attaching PDF to Zotero item: {parent_item_key}")
-            print(f"PDF path: {pdf_path}")
-            print(f"PDF file size: {os.path.getsize(pdf_path)} bytes")
-            
-            # Get the file info
             filename = os.path.basename(pdf_path)
-            filesize = os.path.getsize(pdf_path)
+            filesize = file_stat.st_size
             
-            # First attempt: Use attachment_simple which is the standard pyzotero method
-            try:
-                print(f"Attempting attachment_simple with file: {filename}")
-                # attachment_simple in pyzotero expects a list of paths and the parent item key
-                result = self.zot.attachment_simple([pdf_path], parent_item_key)
-                
-                if result:
-                    print(f"PDF successfully attached via attachment_simple")
-                    return {"success": True, "message": "PDF attached successfully"}
-                else:
-                    print("attachment_simple returned False/None")
-                    
-            except Exception as e:
-                print(f"attachment_simple failed: {e}")
+            logger.debug("Attaching PDF %s (%d bytes) to Zotero item: %s", pdf_path, filesize, parent_item_key)
+            # attachment_simple in pyzotero expects a list of paths and the parent item key
+            result = self._thread_client().attachment_simple([pdf_path], parent_item_key)
             
-            # Second attempt: Try upload_attachment if available (newer pyzotero versions)
-            try:
-                print("Attempting upload_attachment method...")
-                # Some versions of pyzotero have this method
-                result = self.zot.upload_attachment(pdf_path, parent_item_key)
-                
-                if result:
-                    print(f"PDF successfully uploaded via upload_attachment")
-                    return {"success": True, "message": "PDF uploaded successfully"}
-                    
-            except (AttributeError, TypeError) as e:
-                print(f"upload_attachment not available or failed: {e}")
+            # attachment_simple reports uploaded and already-present files separately
+            if result.get('success') or result.get('unchanged'):
+                logger.info("PDF %s attached to Zotero item %s", filename, parent_item_key)
+                return {"success": True, "message": "PDF attached successfully"}
             
-            # Third attempt: Manual file upload with proper attachment creation
-            try:
-                print("Attempting manual file upload...")
-                
-                # Step 1: Create attachment item with proper linkMode
-                attachment_template = self.zot.item_template('attachment')
-                attachment_template['parentItem'] = parent_item_key
-                attachment_template['linkMode'] = 'imported_file'
-                attachment_template['title'] = filename
-                attachment_template['filename'] = filename
-                attachment_template['contentType'] = 'application/pdf'
-                
-                print(f"Creating attachment item for: {filename}")
-                created = self.zot.create_items([attachment_template])
-                
-                if created and created.get('successful'):
-                    # Get the attachment key - handle different response formats
-                    if '0' in created['successful']:
-                        attachment_info = created['successful']['0']
-                    else:
-                        # Get the first item if indexed differently
-                        first_key = list(created['successful'].keys())[0]
-                        attachment_info = created['successful'][first_key]
-                    
-                    attachment_key = attachment_info.get('key') or attachment_info.get('data', {}).get('key')
-                    
-                    if not attachment_key:
-                        print(f"Could not extract attachment key from response: {attachment_info}")
-                        return {"success": False, "error": "Failed to get attachment key"}
-                    
-                    print(f"Attachment item created with key: {attachment_key}")
-                    
-                    # Step 2: Try to upload the actual file using different methods
-                    try:
-                        # Method 1: file_upload_auth + upload_file (if available)
-                        print("Trying file_upload_auth method...")
-                        upload_auth = self.zot.file_upload_auth(
-                            attachment_key,
-                            filename=filename,
-                            filesize=filesize,
-                            mtime=int(os.path.getmtime(pdf_path))
-                        )
-                        
-                        if upload_auth:
-                            with open(pdf_path, 'rb') as f:
-                                upload_result = self.zot.upload_file(f, upload_auth)
-                            
-                            if upload_result:
-                                print("PDF file uploaded successfully via file_upload_auth")
-                                return {"success": True, "message": "PDF uploaded successfully"}
-                    except (AttributeError, KeyError) as auth_error:
-                        print(f"file_upload_auth method not available: {auth_error}")
-                    
-                    # Method 2: Direct attachment upload (fallback)
-                    try:
-                        print("Trying direct attachment upload...")
-                        with open(pdf_path, 'rb') as f:
-                            result = self.zot.upload_attachment(f, attachment_key)
-                        if result:
-                            print("PDF uploaded via direct attachment upload")
-                            return {"success": True, "message": "PDF uploaded successfully"}
-                    except Exception as direct_error:
-                        print(f"Direct upload failed: {direct_error}")
-                    
-                    # If we created the attachment but couldn't upload the file
-                    print("Warning: Attachment metadata created but file upload failed")
-                    return {"success": True, "message": "Attachment created (metadata only, file upload failed)"}
-                else:
-                    print(f"Failed to create attachment item: {created}")
-                    return {"success": False, "error": "Failed to create attachment item"}
-                    
-            except Exception as e:
-                print(f"Manual upload failed with error: {e}")
-                import traceback
-                traceback.print_exc()
-                return {"success": False, "error": f"PDF attachment failed: {str(e)}"}
+            logger.warning("Zotero did not accept PDF %s: %s", filename, result)
+            return {"success": False, "error": "PDF attachment failed"}
                 
         except Exception as e:
-            print(f"Unexpected error during PDF attachment: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.error("Unexpected error during PDF attachment: %s", e)
+            logger.debug("PDF attachment failure", exc_info=True)
             return {"success": False, "error": f"PDF attachment failed: {str(e)}"}
     
+    def attach_pdfs_bulk(self, items):
+        """
+        Add several PDF attachments, one upload call per parent item
+        
+        PDFs that share a parent go up in a single attachment_simple call;
+        the groups for different parents are uploaded concurrently.
+        
+        Args:
+            items: List of (parent_item_key, pdf_path) tuples
+            
+        Returns:
+            list: Success/error response for each item, in order
+        """
+        if not items:
+            return []
+        
+        group_futures = self._submit_pdf_groups(items)
+        return [group_futures[parent_item_key].result()[pdf_path] for parent_item_key, pdf_path in items]
+    
+    def _submit_pdf_groups(self, items):
+        """Start one upload task per parent item, returning its future by parent key"""
+        paths_by_parent = defaultdict(list)
+        for parent_item_key, pdf_path in items:
+            paths_by_parent[parent_item_key].append(pdf_path)
+        
+        # Each upload is several network round trips, so overlap them across parents
+        executor = self._get_upload_executor()
+        return {
+            parent_item_key: executor.submit(self._attach_pdf_group, parent_item_key, pdf_paths)
+            for parent_item_key, pdf_paths in paths_by_parent.items()
+        }
+    
+    def _get_upload_executor(self):
+        """Return the upload worker pool, starting it on first use"""
+        with self._upload_executor_lock:
+            if self._upload_executor is None:
+                self._upload_executor = ThreadPoolExecutor(
+                    max_workers=max(1, min(Config.ZOTERO_UPLOAD_WORKERS, MAX_UPLOAD_WORKERS)),
+                    thread_name_prefix='zotero-upload'
+                )
+            return self._upload_executor
+    
+    def _attach_pdf_group(self, parent_item_key, pdf_paths):
+        """Attach PDFs to one parent item, returning a response per path"""
+        if len(pdf_paths) == 1:
+            return {pdf_paths[0]: self.add_pdf_attachment(parent_item_key, pdf_paths[0])}
+        
+        try:
+            logger.debug("Attaching %d PDFs to Zotero item: %s", len(pdf_paths), parent_item_key)
+            result = self._thread_client().attachment_simple(pdf_paths, parent_item_key)
+        except Exception as e:
+            logger.warning("attachment_simple failed for %s, attaching one at a time: %s", parent_item_key, e)
+            return {pdf_path: self.add_pdf_attachment(parent_item_key, pdf_path) for pdf_path in pdf_paths}
+        
+        # pyzotero reports each attachment template, with the path as its filename
+        responses = {}
+        for attachment in result.get('success', []) + result.get('unchanged', []):
+            responses[attachment['filename']] = {"success": True, "message": "PDF attached successfully"}
+        for pdf_path in pdf_paths:
+            responses.setdefault(pdf_path, {"success": False, "error": "PDF attachment failed"})
+        return responses
+    
     def _file_exists(self, file_path):
-        """Check if file exists and is readable"""
+        """Check if file exists"""
+        return self._file_stat(file_path) is not None
+    
+    def _file_stat(self, file_path):
+        """Stat a file, returning None unless it is a regular file"""
         try:
-            return os.path.isfile(file_path) and os.access(file_path, os.R_OK)
-        except:
-            return False
+            file_stat = os.stat(file_path)
+        except (OSError, TypeError, ValueError):
+            return None
+        
+        # Unreadable files fail on open and are reported by the upload call
+        return file_stat if stat.S_ISREG(file_stat.st_mode) else None
+    
+    def _api_info(self, path, ttl=API_INFO_TTL):
+        """GET a Zotero API metadata endpoint, reusing the response for ttl seconds"""
+        now = time.monotonic()
+        cached = self._api_info_cache.get(path)
+        if cached and now - cached[0] < ttl:
+            return cached[1]
+        
+        response = (self.session or requests).get(
+            f"{Config.ZOTERO_API_URL}{path}",
+            headers={'Zotero-API-Key': self.api_key, 'Zotero-API-Version': '3'},
+            timeout=30
+        )
+        response.raise_for_status()
+        info = response.json()
+        self._api_info_cache[path] = (now, info)
+        return info
+    
+    def _get_group_info(self):
+        """Return the configured group's metadata"""
+        return self._api_info(f"/groups/{self.group_id}", ttl=GROUP_INFO_TTL).get('data', {})
     
     def test_connection(self):
         """Test the Zotero API connection using pyzotero"""
@@ -265,10 +591,9 @@ class ZoteroIntegration:
             return {"success": False, "error": "Zotero client not initialized"}
         
         try:
-            #
             if self.group_id:
                 # For group libraries, get group info
-                info = self.zot.group_info()
+                info = self._get_group_info()
                 return {
                     "success": True,
                     "user_id": self.user_id,
@@ -286,3 +611,18 @@ class ZoteroIntegration:
                 
         except Exception as e:
             return {"success": False, "error": f"Failed to get user info: {str(e)}"}
+    
+    def get_user_info(self):
+        """Look up the numeric user ID and username that own the API key"""
+        if not self.api_key:
+            return {"success": False, "error": "API key not configured"}
+        
+        try:
+            info = self._api_info("/keys/current")
+            return {
+                "success": True,
+                "user_id": info.get('userID'),
+                "username": info.get('username', 'Unknown')
+            }
+        except Exception as e:
+            return {"success": False, "error": f"Failed to get user info: {str(e)}"}